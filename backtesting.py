@@ -2,12 +2,15 @@
 
 import os
 import json
+import csv
+import numpy as np
 import pandas as pd
 from binance.client import Client
 
 CONFIG_PATH = "config.json"
 LOGS_DIR = "logs"
 CSV_PATH = os.path.join(LOGS_DIR, "backtesting.csv")
+EQUITY_CSV_PATH = os.path.join(LOGS_DIR, "equity_daily.csv")
 
 def load_config():
     # Load settings from config.json, else use defaults.
@@ -77,13 +80,14 @@ def backtest_strategy(data, cfg):
         "tp_1_hit": False,
         "last_realized_loss": 0,
         "wins": 0,
-        "losses": 0,
-        "max_drawdown": 0,
-        "last_peak": cfg["initial_bank"]
+        "losses": 0
     }
     fee_rate = cfg.get("fee_rate", 0.001)
     log_rows = []
-    for i, row in data.iterrows():
+    # Mark-to-market equity and in-market flag per candle, filled in place
+    equity = np.empty(len(data))
+    in_market = np.zeros(len(data), dtype=bool)
+    for n, (_, row) in enumerate(data.iterrows()):
         rsi = row['RSI']
         price = row['close']
         ts = row['timestamp']
@@ -201,13 +205,9 @@ def backtest_strategy(data, cfg):
                 state['losses'] += 1
                 state['last_realized_loss'] = realized_loss
 
-        # Drawdown tracking
-        total_value = state['bank'] + state['holdings'] * price
-        if total_value > state['last_peak']:
-            state['last_peak'] = total_value
-        dd = (total_value - state['last_peak']) / state['last_peak'] * 100
-        if dd < state['max_drawdown']:
-            state['max_drawdown'] = dd
+        # Equity tracking (drawdown etc. computed afterwards from the array)
+        equity[n] = state['bank'] + state['holdings'] * price
+        in_market[n] = state['holdings'] > 0
 
         # Log the trade
         if action is not None:
@@ -232,15 +232,88 @@ def backtest_strategy(data, cfg):
     roi = profit_loss / cfg["initial_bank"]
     winrate = state['wins'] / (state['wins'] + state['losses']) if (state['wins'] + state['losses']) > 0 else 0
 
+    timestamps = data['timestamp'].to_numpy(dtype='datetime64[ns]')
+    risk = compute_risk_metrics(timestamps, equity, in_market, cfg["initial_bank"])
+
     summary = {
         "profit_loss": profit_loss,
         "roi": roi,
         "winrate": winrate,
         "wins": state['wins'],
         "losses": state['losses'],
-        "max_drawdown": state['max_drawdown']
+        **risk
     }
-    return log_rows, summary
+    return log_rows, summary, equity
+
+def compute_risk_metrics(timestamps, equity, in_market, initial_bank):
+    # Vectorized risk stats from the per-candle equity array.
+    if len(equity) == 0:
+        return {
+            "max_drawdown": 0.0, "sharpe": 0.0, "sortino": 0.0,
+            "exposure": 0.0, "time_in_drawdown": 0.0, "monthly_returns": {}
+        }
+
+    # Drawdown vs running peak (peak never below the starting bank), in %
+    peaks = np.maximum(np.maximum.accumulate(equity), initial_bank)
+    drawdown = (equity - peaks) / peaks * 100
+
+    # Per-candle returns, first candle measured against the starting bank
+    prev = np.concatenate(([initial_bank], equity[:-1]))
+    returns = equity / prev - 1
+
+    # Annualize with the candle spacing (crypto trades 24/7)
+    if len(timestamps) > 1:
+        step = np.median(np.diff(timestamps).astype('timedelta64[s]').astype(float))
+    else:
+        step = 0
+    periods_per_year = 365 * 24 * 3600 / step if step > 0 else 0
+    mean_ret = returns.mean()
+    std_ret = returns.std(ddof=1) if len(returns) > 1 else 0
+    downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+    sharpe = mean_ret / std_ret * np.sqrt(periods_per_year) if std_ret > 0 else 0.0
+    sortino = mean_ret / downside * np.sqrt(periods_per_year) if downside > 0 else 0.0
+
+    # Month-end equity vs previous month-end (first month vs starting bank)
+    months = timestamps.astype('datetime64[M]')
+    month_ends = np.flatnonzero(np.append(months[1:] != months[:-1], True))
+    month_equity = equity[month_ends]
+    month_start = np.concatenate(([initial_bank], month_equity[:-1]))
+    monthly = month_equity / month_start - 1
+    monthly_returns = {str(m): float(r) for m, r in zip(months[month_ends], monthly)}
+
+    return {
+        "max_drawdown": float(drawdown.min()),
+        "sharpe": float(sharpe),
+        "sortino": float(sortino),
+        "exposure": float(in_market.mean()),
+        "time_in_drawdown": float(np.mean(drawdown < 0)),
+        "monthly_returns": monthly_returns
+    }
+
+def iter_equity_ohlc(timestamps, equity, freq='D'):
+    # Stream the equity curve downsampled to OHLC buckets (default: per day).
+    if len(equity) == 0:
+        return
+    buckets = timestamps.astype(f'datetime64[{freq}]')
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = np.append(starts[1:], len(equity)) - 1
+    highs = np.maximum.reduceat(equity, starts)
+    lows = np.minimum.reduceat(equity, starts)
+    for k in range(len(starts)):
+        yield {
+            "timestamp": str(buckets[starts[k]]),
+            "open": float(equity[starts[k]]),
+            "high": float(highs[k]),
+            "low": float(lows[k]),
+            "close": float(equity[ends[k]])
+        }
+
+def write_equity_csv(timestamps, equity, path=EQUITY_CSV_PATH, freq='D'):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["timestamp", "open", "high", "low", "close"])
+        writer.writeheader()
+        for bar in iter_equity_ohlc(timestamps, equity, freq):
+            writer.writerow(bar)
 
 def main():
     cfg = load_config()
@@ -250,15 +323,22 @@ def main():
     data = download_data(cfg["pair"], cfg["timeframe"], cfg["starting_date"], cfg["ending_date"])
     data['RSI'] = calculate_rsi(data['close'], periods=cfg["rsi_periods"], ema=cfg["rsi_ema"])
     print("Running backtest...")
-    logs, stats = backtest_strategy(data, cfg)
+    logs, stats, equity = backtest_strategy(data, cfg)
     pd.DataFrame(logs).to_csv(CSV_PATH, index=False)
     print(f"Backtest log written to {CSV_PATH}")
+    write_equity_csv(data['timestamp'].to_numpy(dtype='datetime64[ns]'), equity)
+    print(f"Daily equity OHLC written to {EQUITY_CSV_PATH}")
     print("=== Backtest Summary ===")
     print(f"Profit/Loss: {stats['profit_loss']:.2f}")
     print(f"ROI: {stats['roi']*100:.2f}%")
     print(f"WinRate: {stats['winrate']*100:.2f}%")
     print(f"Wins: {stats['wins']} | Losses: {stats['losses']}")
     print(f"Max Drawdown: {stats['max_drawdown']:.2f}%")
+    print(f"Sharpe: {stats['sharpe']:.2f} | Sortino: {stats['sortino']:.2f}")
+    print(f"Exposure: {stats['exposure']*100:.2f}% | Time in Drawdown: {stats['time_in_drawdown']*100:.2f}%")
+    print("Monthly Returns:")
+    for month, ret in stats['monthly_returns'].items():
+        print(f"  {month}: {ret*100:.2f}%")
 
 if __name__ == '__main__':
     main()
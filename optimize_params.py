@@ -49,13 +49,14 @@ for params in itertools.product(
 
     # Calculate RSI for this setting
     data['RSI'] = calculate_rsi(data['close'], periods=rsi_p, ema=rsi_ema)
-    logs, stats = backtest_strategy(data, cfg_test)
+    logs, stats, equity = backtest_strategy(data, cfg_test)
     results.append({
         "RSI1": buy_rsi_1, "RSI2": buy_rsi_2, "RSI3": buy_rsi_3,
         "SL": sl, "TP1": tp1, "TP2": tp2,
         "rsi_periods": rsi_p, "rsi_ema": rsi_ema, "martingale": martingale,
         "ROI": stats["roi"], "WinRate": stats["winrate"],
-        "Profit": stats["profit_loss"], "Drawdown": stats["max_drawdown"]
+        "Profit": stats["profit_loss"], "Drawdown": stats["max_drawdown"],
+        "Sharpe": stats["sharpe"], "Sortino": stats["sortino"]
     })
     tested += 1
     if tested % 20 == 0:
@@ -71,9 +72,9 @@ print(f"Results saved to {RESULTS_CSV}")
 # Print top 10 by ROI
 top_roi = df.sort_values("ROI", ascending=False).head(10)
 print("\n=== Top 10 by ROI ===")
-print(top_roi[["RSI1", "RSI2", "RSI3", "SL", "TP1", "TP2", "rsi_periods", "rsi_ema", "martingale", "ROI", "WinRate", "Profit", "Drawdown"]])
+print(top_roi[["RSI1", "RSI2", "RSI3", "SL", "TP1", "TP2", "rsi_periods", "rsi_ema", "martingale", "ROI", "WinRate", "Profit", "Drawdown", "Sharpe", "Sortino"]])
 
 # Print top 10 by WinRate
 top_win = df.sort_values("WinRate", ascending=False).head(10)
 print("\n=== Top 10 by WinRate ===")
-print(top_win[["RSI1", "RSI2", "RSI3", "SL", "TP1", "TP2", "rsi_periods", "rsi_ema", "martingale", "ROI", "WinRate", "Profit", "Drawdown"]])
+print(top_win[["RSI1", "RSI2", "RSI3", "SL", "TP1", "TP2", "rsi_periods", "rsi_ema", "martingale", "ROI", "WinRate", "Profit", "Drawdown", "Sharpe", "Sortino"]])